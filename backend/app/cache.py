@@ -0,0 +1,155 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from typing import Callable, Iterable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+# 缓存配置，可通过环境变量调整
+CACHE_TTL_SECONDS = float(os.environ.get("RESPONSE_CACHE_TTL", 30))
+CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 256))
+# 超过该大小的响应不进入缓存，避免大列表占满内存
+CACHE_MAX_ENTRY_BYTES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRY_BYTES", 1024 * 1024))
+
+# 缓存标签: 列表 / 统计类响应依赖全部海报，详情响应只依赖单个海报
+TAG_LIST = "posters:list"
+TAG_STATS = "posters:stats"
+
+
+def poster_tag(poster_id: int) -> str:
+    return f"poster:{poster_id}"
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: str
+    last_modified: float
+    tags: tuple
+    expires_at: float = field(default=0.0)
+
+
+class ResponseCache:
+    """
+    进程内的 TTL + LRU 响应缓存
+    写操作通过 invalidate() 按标签精确失效；多进程部署时每个进程各自维护一份缓存
+    """
+
+    def __init__(
+        self,
+        ttl: float = CACHE_TTL_SECONDS,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_entry_bytes: int = CACHE_MAX_ENTRY_BYTES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 每个标签最近一次被修改的时间，作为 Last-Modified
+        self._modified_at = {}
+        self._started_at = time.time()
+        # 每次失效都会递增，用于丢弃在写操作期间构建出的过期响应
+        self.version = 0
+
+    def last_modified(self, tags: Iterable[str]) -> float:
+        with self._lock:
+            return max([self._modified_at.get(tag, self._started_at) for tag in tags] or [self._started_at])
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry, version: int) -> None:
+        with self._lock:
+            if version != self.version or len(entry.body) > self.max_entry_bytes:
+                return
+            entry.expires_at = time.monotonic() + self.ttl
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str) -> None:
+        """在写操作提交后调用，移除所有带有给定标签的缓存项"""
+        tags = set(tags)
+        now = time.time()
+        with self._lock:
+            self.version += 1
+            for tag in tags:
+                self._modified_at[tag] = now
+            for key in [key for key, entry in self._entries.items() if tags.intersection(entry.tags)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def invalidate_poster(poster_id: Optional[int] = None) -> None:
+    """海报被创建 / 修改 / 删除后调用"""
+    tags = [TAG_LIST, TAG_STATS]
+    if poster_id is not None:
+        tags.append(poster_tag(poster_id))
+    response_cache.invalidate(*tags)
+
+
+def _is_not_modified(request: Request, entry: CacheEntry) -> bool:
+    """
+    只依据 If-None-Match 判断是否返回 304
+    Last-Modified 来自进程内的失效时间且只精确到秒，同一秒内的写入或其他进程中的写入都无法反映，
+    因此不使用 If-Modified-Since，由内容哈希 ETag 保证结果正确
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or entry.etag in candidates or f"W/{entry.etag}" in candidates
+
+
+def cached_response(request: Request, tags: Iterable[str], build: Callable[[], bytes]) -> Response:
+    """
+    返回带 ETag / Last-Modified 的 JSON 响应，命中缓存时不再查询数据库
+    build: 缓存未命中时调用，返回序列化后的 JSON 字节
+    """
+    tags = tuple(tags)
+    # 参数需重新编码，否则 "search=t%26skip%3D0" 与 "search=t&skip=0" 会得到相同的键
+    key = request.url.path + "?" + urlencode(sorted(request.query_params.multi_items()))
+
+    entry = response_cache.get(key)
+    if entry is None:
+        version = response_cache.version
+        body = build()
+        entry = CacheEntry(
+            body=body,
+            etag='"' + hashlib.md5(body).hexdigest() + '"',
+            last_modified=response_cache.last_modified(tags),
+            tags=tags,
+        )
+        response_cache.set(key, entry, version)
+
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": formatdate(entry.last_modified, usegmt=True),
+        # 允许浏览器保存响应，但每次使用前都需要向服务器验证
+        "Cache-Control": "no-cache",
+    }
+    if _is_not_modified(request, entry):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
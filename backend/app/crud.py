@@ -1,24 +1,133 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from datetime import datetime
 from . import models
+from .cache import invalidate_poster
 from .schemas.poster import PosterBase
+from .services.datetime_parser import parse_event_datetime, MAX_EVENT_SPAN
 import os
 
 def get_poster(db: Session, poster_id: int):
     """根据ID获取单个海报"""
     return db.query(models.Poster).filter(models.Poster.id == poster_id).first()
 
-def get_posters(db: Session, skip: int = 0, limit: int = 100, search: str = None):
+def _to_naive_local(value: datetime) -> datetime:
+    """event_start / event_end 以不带时区的本地时间存储，带时区的参数需先换算为本地时间"""
+    if value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+def filter_posters(
+    query,
+    search: str = None,
+    event_type: str = None,
+    status: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+):
     """
-    (更新) 获取海报列表，支持搜索
-    按创建时间倒序排列，最新的在最前面
+    为海报查询追加过滤条件
+    date_from / date_to 按活动时间段的重叠进行匹配。event_end 没有索引，
+    由于活动时长不超过 MAX_EVENT_SPAN，date_from 同时换算为 event_start 的下界，
+    使查询可以在 event_start / (event_type, event_start) / (status, event_start) 索引上做范围扫描
     """
-    query = db.query(models.Poster)
-    
     # (新增) 如果提供了搜索词，则在 'title' 字段中进行模糊匹配
     if search:
         query = query.filter(models.Poster.title.ilike(f"%{search}%"))
-        
-    return query.order_by(models.Poster.id.desc()).offset(skip).limit(limit).all()
+    if event_type:
+        query = query.filter(models.Poster.event_type == event_type)
+    if status:
+        query = query.filter(models.Poster.status == status)
+    if date_from:
+        date_from = _to_naive_local(date_from)
+        query = query.filter(
+            models.Poster.event_start >= date_from - MAX_EVENT_SPAN,
+            models.Poster.event_end >= date_from,
+        )
+    if date_to:
+        query = query.filter(models.Poster.event_start <= _to_naive_local(date_to))
+    return query
+
+def order_posters(query, date_from: datetime = None, date_to: datetime = None):
+    """
+    有时间范围过滤时按活动开始时间升序 (与索引顺序一致，无需额外排序)，
+    否则按创建时间倒序，最新的在最前面
+    """
+    if date_from or date_to:
+        return query.order_by(models.Poster.event_start, models.Poster.id)
+    return query.order_by(models.Poster.id.desc())
+
+def get_posters(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    search: str = None,
+    event_type: str = None,
+    status: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+):
+    """
+    (更新) 获取海报列表，支持搜索、活动类型、审核状态和活动时间范围过滤
+    排序规则见 order_posters
+    """
+    query = filter_posters(
+        db.query(models.Poster),
+        search=search,
+        event_type=event_type,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    query = order_posters(query, date_from=date_from, date_to=date_to)
+    return query.offset(skip).limit(limit).all()
+
+def get_poster_stats(db: Session):
+    """统计海报总数，以及按审核状态、活动类型的分布"""
+    by_status = db.query(models.Poster.status, func.count(models.Poster.id)).group_by(models.Poster.status).all()
+    by_event_type = (
+        db.query(models.Poster.event_type, func.count(models.Poster.id))
+        .group_by(models.Poster.event_type)
+        .all()
+    )
+
+    def to_dict(rows):
+        # 空值统一归入 "未能识别"
+        result = {}
+        for key, count in rows:
+            key = key or "未能识别"
+            result[key] = result.get(key, 0) + count
+        return result
+
+    return {
+        "total": sum(count for _, count in by_status),
+        "by_status": to_dict(by_status),
+        "by_event_type": to_dict(by_event_type),
+    }
+
+def iter_posters(
+    db: Session,
+    columns: list,
+    batch_size: int = 1000,
+    search: str = None,
+    event_type: str = None,
+    status: str = None,
+    date_from: datetime = None,
+    date_to: datetime = None,
+):
+    """
+    (用于导出) 逐行遍历海报，只查询需要的列
+    yield_per 会启用服务端游标 (PostgreSQL) 并分批拉取，内存占用与总行数无关
+    """
+    query = filter_posters(
+        db.query(*[getattr(models.Poster, name) for name in columns]),
+        search=search,
+        event_type=event_type,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return query.order_by(models.Poster.id).yield_per(batch_size)
 
 def create_poster(db: Session, poster_data: PosterBase, raw_text: str, image_url: str):
     """
@@ -27,15 +136,21 @@ def create_poster(db: Session, poster_data: PosterBase, raw_text: str, image_url
     raw_text 是 OCR 识别的原始文本
     image_url 是保存的图片路径
     """
+    # 将自由格式的日期/时间解析为可索引的活动起止时间
+    event_start, event_end = parse_event_datetime(poster_data.date, poster_data.time)
+
     # **poster_data.dict() 将 Pydantic 模型解包为字典
     db_poster = models.Poster(
         **poster_data.model_dump(), 
         raw_ocr_text=raw_text,
         image_url=image_url, 
-        status="pending"  
+        status="pending",
+        event_start=event_start,
+        event_end=event_end,
     )
     db.add(db_poster)
     db.commit()
+    invalidate_poster()
     db.refresh(db_poster)
     return db_poster
 
@@ -45,6 +160,7 @@ def update_poster_status(db: Session, poster_id: int, status: str):
     if db_poster:
         db_poster.status = status
         db.commit()
+        invalidate_poster(poster_id)
         db.refresh(db_poster)
     return db_poster
 
@@ -66,5 +182,6 @@ def delete_poster(db: Session, poster_id: int):
         
         db.delete(db_poster)
         db.commit()
+        invalidate_poster(poster_id)
     return db_poster
 
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.routers import extraction, posters
 from app import models
 from app.database import engine
+from app.migrations import run_migrations
 from fastapi.staticfiles import StaticFiles # 导入静态文件
 import os 
 
@@ -11,6 +12,7 @@ UPLOAD_DIR = "static/uploads"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 models.Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 app = FastAPI(
     title="校园海报信息提取系统 API",
@@ -0,0 +1,90 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from . import models
+from .database import SessionLocal, engine as default_engine
+from .services.datetime_parser import parse_event_datetime
+
+# create_all 只会创建缺失的表，不会给已有的表补列，这里手动维护新增的列
+_ADDED_COLUMNS = ["event_start", "event_end"]
+
+
+def upgrade_posters_table(engine: Engine) -> bool:
+    """
+    为已有的 posters 表补充 event_start / event_end 列及相关索引
+    :return: 是否新增了列 (新增时需要回填历史数据)
+    """
+    table = models.Poster.__table__
+    existing = {col["name"] for col in inspect(engine).get_columns(table.name)}
+    missing = [name for name in _ADDED_COLUMNS if name not in existing]
+
+    with engine.begin() as conn:
+        for name in missing:
+            # 列类型按当前数据库方言生成 (SQLite: DATETIME, PostgreSQL: TIMESTAMP WITHOUT TIME ZONE)
+            column_type = table.c[name].type.compile(dialect=engine.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+            print(f"--- [Migration] 已为 {table.name} 表添加列: {name} ---")
+
+    for index in table.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    return bool(missing)
+
+
+def backfill_event_datetimes(db: Session, batch_size: int = 500, only_missing: bool = True) -> int:
+    """
+    根据已有的 date/time 文本回填 event_start / event_end
+    缺少年份的日期以该记录的 created_at 作为参考
+    :return: 成功解析的记录数
+    """
+    query = db.query(models.Poster)
+    if only_missing:
+        query = query.filter(models.Poster.event_start.is_(None))
+
+    updated = 0
+    last_id = 0
+    while True:
+        # 按主键分批处理，避免一次性加载整张表
+        batch = (
+            query.filter(models.Poster.id > last_id)
+            .order_by(models.Poster.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        for poster in batch:
+            event_start, event_end = parse_event_datetime(
+                poster.date, poster.time, reference=poster.created_at
+            )
+            poster.event_start = event_start
+            poster.event_end = event_end
+            if event_start is not None:
+                updated += 1
+        last_id = batch[-1].id
+        db.commit()
+
+    print(f"--- [Migration] 已回填 {updated} 条海报的活动时间 ---")
+    return updated
+
+
+def run_migrations(engine: Engine = default_engine):
+    """应用启动时调用：补齐表结构，并在新增列后回填历史数据"""
+    if upgrade_posters_table(engine):
+        db = SessionLocal(bind=engine)
+        try:
+            backfill_event_datetimes(db)
+        finally:
+            db.close()
+
+
+# 手动重新解析全部历史数据: python -m app.migrations
+if __name__ == "__main__":
+    models.Base.metadata.create_all(bind=default_engine)
+    upgrade_posters_table(default_engine)
+    db = SessionLocal()
+    try:
+        backfill_event_datetimes(db, only_missing=False)
+    finally:
+        db.close()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -7,6 +7,11 @@ class Poster(Base):
     定义 Poster 数据模型 (即数据库中的 'posters' 表)
     """
     __tablename__ = "posters"
+    __table_args__ = (
+        # 复合索引: 支持 "某类型活动 + 时间范围" 和 "审核状态 + 时间范围" 的查询
+        Index("ix_posters_event_type_event_start", "event_type", "event_start"),
+        Index("ix_posters_status_event_start", "status", "event_start"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -25,5 +30,10 @@ class Poster(Base):
     image_url = Column(String(500), nullable=True)
     raw_ocr_text = Column(Text, nullable=True)
     status = Column(String(50), default="pending", index=True)
+
+    # 由 date/time 字段在入库时解析得到的标准化活动时间，用于范围查询
+    event_start = Column(DateTime, nullable=True, index=True)
+    event_end = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
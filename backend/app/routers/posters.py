@@ -1,24 +1,157 @@
-from fastapi import APIRouter, HTTPException, Depends, Body
+from fastapi import APIRouter, HTTPException, Depends, Body, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Annotated
+from datetime import datetime, date, time
 from app import crud, models
-from app.schemas.poster import PosterResponse
-from app.database import get_db
+from app.schemas.poster import PosterResponse, PosterStats
+from app.database import get_db, SessionLocal
+from app.services import export_service
+from app.cache import cached_response, poster_tag, TAG_LIST, TAG_STATS
+from pydantic import TypeAdapter, BeforeValidator
+import re
 
 router = APIRouter()
 
+_poster_list_adapter = TypeAdapter(List[PosterResponse])
+
+
+def _date_only_to_end_of_day(value):
+    """只给出日期的 date_to (例如 2025-10-26) 表示包含当天，换算为当天的最后时刻"""
+    if isinstance(value, str) and re.fullmatch(r"\d{4}-\d{2}-\d{2}", value.strip()):
+        return datetime.combine(date.fromisoformat(value.strip()), time.max)
+    return value
+
+
+# date_to 查询参数: 完整的日期时间原样使用，只有日期时取当天结束
+DateTo = Annotated[Optional[datetime], BeforeValidator(_date_only_to_end_of_day)]
+
 @router.get("/posters/", response_model=List[PosterResponse], summary="查询海报列表(历史记录)")
 def read_posters(
+    request: Request,
     skip: int = 0, 
     limit: int = 100, 
+    search: Optional[str] = None,
+    event_type: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: DateTo = None,
     db: Session = Depends(get_db)
 ):
     """
-    获取所有海报的列表，按最新排序。
+    获取所有海报的列表，按最新排序；带时间范围过滤时按活动开始时间排序。
     用于前端的“提取历史”和“审核队列”。
+    批量拉取全部数据请使用 /posters/export (流式导出，内存占用不随数据量增长)。
+
+    - date_from / date_to: 返回活动时间与该区间有交集的海报 (例如 "本周的活动")，
+      带时区偏移的时间会先换算为服务器本地时间。
+      只给出日期时，date_from 取当天 0 点，date_to 取当天结束 (即包含 date_to 当天)，
+      例如 date_from=2025-10-20&date_to=2025-10-26
+    - event_type: 按活动类型精确过滤 (例如 "讲座")
+    - status: 按审核状态过滤 (例如审核队列使用 status=pending)
+
+    响应会被缓存，并带有 ETag / Last-Modified，前端轮询时可通过条件请求获得 304。
+    """
+    def build():
+        posters = crud.get_posters(
+            db,
+            skip=skip,
+            limit=limit,
+            search=search,
+            event_type=event_type,
+            status=status,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        return _poster_list_adapter.dump_json(posters)
+
+    return cached_response(request, [TAG_LIST], build)
+
+@router.get("/posters/stats", response_model=PosterStats, summary="海报统计(按状态/活动类型)")
+def read_poster_stats(request: Request, db: Session = Depends(get_db)):
+    """
+    用于审核看板的汇总数据，结果会被缓存，直到有海报被创建、修改或删除。
+    """
+    def build():
+        return PosterStats(**crud.get_poster_stats(db)).model_dump_json().encode("utf-8")
+
+    return cached_response(request, [TAG_STATS], build)
+
+@router.get("/posters/export", summary="流式导出海报 (CSV / JSONL)")
+def export_posters(
+    format: str = "csv",
+    columns: Optional[str] = None,
+    gzip: bool = False,
+    search: Optional[str] = None,
+    event_type: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: DateTo = None,
+):
+    """
+    用于报表任务批量拉取数据，过滤参数与列表接口一致 (date_to 只给出日期时同样包含当天)。
+    数据按批次从数据库读取并边读边写，导出 1k 行和 1M 行的内存占用基本相同。
+
+    - format: csv 或 jsonl
+    - columns: 逗号分隔的列名，例如 "id,title,event_start"，默认导出全部列
+    - gzip: 为 true 时返回 .gz 压缩文件
     """
-    posters = crud.get_posters(db, skip=skip, limit=limit)
-    return posters
+    if format not in export_service.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="无效的导出格式，仅支持 csv 或 jsonl")
+    try:
+        selected = export_service.parse_columns(columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def stream():
+        # 流式响应会在请求依赖结束后才被消费，因此在生成器内部自行管理会话
+        db = SessionLocal()
+        try:
+            rows = crud.iter_posters(
+                db,
+                columns=selected,
+                search=search,
+                event_type=event_type,
+                status=status,
+                date_from=date_from,
+                date_to=date_to,
+            )
+            if format == "csv":
+                chunks = export_service.iter_csv(rows, selected)
+            else:
+                chunks = export_service.iter_jsonl(rows, selected)
+            yield from export_service.iter_encoded(chunks, compress=gzip)
+        finally:
+            db.close()
+
+    filename = f"posters.{format}"
+    media_type = export_service.EXPORT_FORMATS[format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.get("/posters/{poster_id}", response_model=PosterResponse, summary="查询单个海报")
+def read_poster(
+    poster_id: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    获取单个海报的详细信息。
+    """
+    def build():
+        db_poster = crud.get_poster(db, poster_id=poster_id)
+        if db_poster is None:
+            raise HTTPException(status_code=404, detail="海报未找到")
+        return PosterResponse.model_validate(db_poster).model_dump_json().encode("utf-8")
+
+    return cached_response(request, [poster_tag(poster_id)], build)
 
 @router.put("/posters/{poster_id}", response_model=PosterResponse, summary="确认海报(更新状态)")
 def confirm_poster(
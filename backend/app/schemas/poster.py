@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import Optional, Dict
 from datetime import datetime
 
 # 这个 Pydantic 模型用于定义 LLM 返回的数据结构
@@ -29,7 +29,15 @@ class PosterResponse(PosterBase):
     raw_ocr_text: Optional[str] = None
     image_url: Optional[str] = None 
     status: str
+    event_start: Optional[datetime] = None
+    event_end: Optional[datetime] = None
     created_at: datetime
 
     # (修改) Pydantic v2 的正确配置
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# 海报统计信息 (用于审核看板)
+class PosterStats(BaseModel):
+    total: int
+    by_status: Dict[str, int]
+    by_event_type: Dict[str, int]
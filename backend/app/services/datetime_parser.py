@@ -0,0 +1,175 @@
+import re
+from datetime import datetime, date, time, timedelta
+from typing import Optional, Tuple, List
+
+# LLM 在识别失败时会返回这些占位值
+EMPTY_VALUES = {"", "none", "null", "未能识别", "无", "未知"}
+
+# 日期: 2025年10月28日 / 2025-10-28 / 2025/10/28 / 2025.10.28 / 10月28日
+# 省略年份时只接受 "月" 作为分隔符，避免把 "19:00-21:00" 误认为日期
+_DATE_PATTERN = re.compile(
+    r"(?<!\d)(?:"
+    r"(?P<year>\d{4})\s*[年\-/.]\s*(?P<month>\d{1,2})\s*[月\-/.]\s*(?P<day>\d{1,2})"
+    r"|(?P<short_month>\d{1,2})\s*月\s*(?P<short_day>\d{1,2})"
+    r")\s*[日号]?"
+)
+
+# 时间: 14:30 / 14：30 / 2点 / 2点半 / 14时30分
+_TIME_PATTERN = re.compile(
+    r"(?P<period>凌晨|早上|早晨|上午|中午|下午|傍晚|晚上|晚间|今晚)?\s*"
+    r"(?P<hour>\d{1,2})\s*(?:[:：]\s*(?P<minute>\d{2})|[点时]\s*(?:(?P<half>半)|(?P<cn_minute>\d{1,2})\s*分?)?)"
+)
+
+# 日期区间的结束部分: "-9月16日" / "-9.16" / "-16日"
+_DATE_RANGE_TAIL = re.compile(
+    r"\s*[-~～至到—–]\s*(?:(?P<month>\d{1,2})\s*[月./\-]\s*)?(?P<day>\d{1,2})\s*[日号]?(?![\d:：点时])"
+)
+
+# 时间区间的分隔符: "14:00-16:00" / "9点至11点"
+_TIME_RANGE_SEPARATOR = re.compile(r"\s*[-~～至到—–]+\s*")
+
+# 单个活动的最长持续时间。超过该时长的区间会被截断，
+# 以保证按时间范围查询时可以只依据 event_start 索引确定扫描的起点
+MAX_EVENT_SPAN = timedelta(days=92)
+
+_PM_PERIODS = {"下午", "傍晚", "晚上", "晚间", "今晚"}
+_NIGHT_PERIODS = {"晚上", "晚间", "今晚"}
+
+
+def _is_empty(value: Optional[str]) -> bool:
+    return value is None or value.strip().lower() in EMPTY_VALUES
+
+
+def _following_date(previous: date, month: int, day: int) -> date:
+    """
+    省略年份的日期沿用前一个日期的年份；若因此早于前一个日期，
+    说明区间跨年 (例如 "12月30日-1月2日")，年份加一
+    """
+    candidate = date(previous.year, month, day)
+    if candidate < previous:
+        candidate = date(previous.year + 1, month, day)
+    return candidate
+
+
+def _parse_dates(text: str, reference: datetime) -> List[date]:
+    """提取文本中出现的所有日期，缺省年份/月份时沿用前一个日期或参考时间的年份"""
+    dates = []
+    year = reference.year
+    last_end = 0
+    for match in _DATE_PATTERN.finditer(text):
+        try:
+            if match.group("year"):
+                year = int(match.group("year"))
+                parsed = date(year, int(match.group("month")), int(match.group("day")))
+            else:
+                month, day = int(match.group("short_month")), int(match.group("short_day"))
+                parsed = _following_date(dates[-1], month, day) if dates else date(year, month, day)
+        except ValueError:
+            continue
+        dates.append(parsed)
+        year = parsed.year
+        last_end = match.end()
+
+    # 兼容 "9月15日-16日"、"2025.9.15-9.16" 这种省略年份/月份的结束日期
+    if len(dates) == 1:
+        tail = _DATE_RANGE_TAIL.match(text, last_end)
+        if tail:
+            month = int(tail.group("month") or dates[0].month)
+            try:
+                dates.append(_following_date(dates[0], month, int(tail.group("day"))))
+            except ValueError:
+                pass
+    return dates
+
+
+def _parse_times(text: str) -> List[Tuple[timedelta, re.Match]]:
+    """
+    提取文本中出现的所有时间点，返回 (距当天 0 点的偏移, 匹配对象)
+    "下午 2:30" 会被换算为 14:30，"晚上12点" 会被换算为次日 0 点
+    """
+    times = []
+    period = None
+    for match in _TIME_PATTERN.finditer(text):
+        # "下午 14:30-16:00" 中的结束时间沿用开始时间的时段
+        period = match.group("period") or period
+        hour = int(match.group("hour"))
+        if match.group("minute"):
+            minute = int(match.group("minute"))
+        elif match.group("half"):
+            minute = 30
+        elif match.group("cn_minute"):
+            minute = int(match.group("cn_minute"))
+        else:
+            minute = 0
+
+        if period in _NIGHT_PERIODS and hour == 12:
+            hour = 24
+        elif period in _PM_PERIODS and hour < 12:
+            hour += 12
+        elif period == "中午" and hour < 6:
+            hour += 12
+
+        if hour > 24 or minute > 59 or (hour == 24 and minute > 0):
+            continue
+        times.append((timedelta(hours=hour, minutes=minute), match))
+    return times
+
+
+def _parse_time_range(text: str) -> Tuple[Optional[timedelta], Optional[timedelta]]:
+    """
+    解析开始时间，以及紧跟其后的结束时间 (仅当两者以区间分隔符相连时)
+    "14:00-16:00（签到13:30）" 中的签到时间不会被当作结束时间
+    """
+    times = _parse_times(text)
+    if not times:
+        return None, None
+
+    start, start_match = times[0]
+    if len(times) < 2:
+        return start, None
+    end, end_match = times[1]
+    if not _TIME_RANGE_SEPARATOR.fullmatch(text, start_match.end(), end_match.start()):
+        return start, None
+    # 跨越午夜的区间，例如 "22:00-01:00"
+    if end < start:
+        end += timedelta(days=1)
+    return start, end
+
+
+def parse_event_datetime(
+    date_str: Optional[str],
+    time_str: Optional[str],
+    reference: Optional[datetime] = None,
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    将 LLM 返回的自由格式日期/时间解析为 (event_start, event_end)。
+
+    :param date_str: 例如 "2025年10月28日"、"2022年9月15日-9月16日"
+    :param time_str: 例如 "下午 14:30"、"14:00-16:00"
+    :param reference: 日期中缺少年份时使用的参考时间 (默认为当前时间)
+    :return: 无法识别日期时返回 (None, None)；没有结束时间时，结束时间取最后一天的 23:59:59；
+             持续时间不超过 MAX_EVENT_SPAN
+    """
+    if _is_empty(date_str):
+        return None, None
+
+    reference = reference or datetime.now()
+    dates = _parse_dates(date_str, reference)
+    if not dates:
+        return None, None
+
+    # 时间可能写在 date 字段里 (例如 "10月28日 14:30")，也可能在 time 字段中
+    time_text = "" if _is_empty(time_str) else time_str
+    start_time, end_time = _parse_time_range(time_text)
+    if start_time is None:
+        start_time, end_time = _parse_time_range(_DATE_PATTERN.sub(" ", date_str))
+
+    start_date = datetime.combine(dates[0], time.min)
+    end_date = datetime.combine(max(dates[-1], dates[0]), time.min)
+
+    event_start = start_date + (start_time or timedelta(0))
+    if end_time is not None:
+        event_end = end_date + end_time
+    else:
+        event_end = end_date + timedelta(hours=23, minutes=59, seconds=59)
+    return event_start, min(max(event_start, event_end), event_start + MAX_EVENT_SPAN)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Iterable, Iterator, List, Sequence
+
+# 可导出的列 (与 PosterResponse 字段保持一致)
+EXPORT_COLUMNS = [
+    "id", "title", "date", "time", "location", "organizer", "summary",
+    "speaker", "event_type", "target_audience", "contact_info",
+    "registration_info", "image_url", "raw_ocr_text", "status",
+    "event_start", "event_end", "created_at",
+]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+# 每累计多少行向客户端发送一次数据块
+FLUSH_EVERY = 500
+
+
+def parse_columns(columns: str = None) -> List[str]:
+    """解析逗号分隔的列名，未指定时导出全部列"""
+    if not columns:
+        return list(EXPORT_COLUMNS)
+    selected = [name.strip() for name in columns.split(",") if name.strip()]
+    invalid = [name for name in selected if name not in EXPORT_COLUMNS]
+    if invalid or not selected:
+        raise ValueError(f"无效的导出列: {', '.join(invalid)}，可选列: {', '.join(EXPORT_COLUMNS)}")
+    return selected
+
+
+def _to_text(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(rows: Iterable[Sequence], columns: List[str]) -> Iterator[str]:
+    """将查询结果逐块编码为 CSV 文本 (首行为表头)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(["" if value is None else _to_text(value) for value in row])
+        if count % FLUSH_EVERY == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def iter_jsonl(rows: Iterable[Sequence], columns: List[str]) -> Iterator[str]:
+    """将查询结果逐块编码为 JSON Lines (每行一个 JSON 对象)"""
+    lines = []
+    for row in rows:
+        record = {name: _to_text(value) for name, value in zip(columns, row)}
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) >= FLUSH_EVERY:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_encoded(chunks: Iterable[str], compress: bool = False) -> Iterator[bytes]:
+    """将文本块编码为 UTF-8 字节，可选地使用 gzip 流式压缩"""
+    if not compress:
+        for chunk in chunks:
+            if chunk:
+                yield chunk.encode("utf-8")
+        return
+
+    # wbits=31 表示输出带 gzip 头的数据流
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -4,7 +4,6 @@ import json
 import cv2 
 import numpy as np
 from typing import Dict
-from paddleocr import PaddleOCR
 from fastapi import HTTPException
 import base64 
 import httpx
@@ -12,10 +11,13 @@ import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 
+from app.services.ocr_engine import get_profile, create_ocr_engine, parse_ocr_result
+
 # --- 初始化 PaddleOCR ---
+# 通过环境变量 OCR_PROFILE 选择 fast / balanced / accurate，详见 ocr_engine.py
 try:
     print("--- 正在初始化 PaddleOCR 引擎... ---")
-    ocr = PaddleOCR(use_angle_cls=True, lang='ch')
+    ocr = create_ocr_engine(get_profile())
     print("--- PaddleOCR 引擎初始化成功。 ---")
 except Exception as e:
     print(f"--- 初始化 PaddleOCR 失败: {e} ---")
@@ -38,36 +40,7 @@ def ocr_processing(image_bytes: bytes) -> str:
         raise ValueError("无法从字节流解码图片，请检查图片格式是否正确。")
 
     result = ocr.ocr(img)
-    lines = []
-    
-    if result and result[0] is not None:
-        try:
-            if 'rec_texts' in result[0] and 'rec_scores' in result[0]:
-                for i in range(len(result[0]['rec_texts'])):
-                    text = result[0]['rec_texts'][i]
-                    confidence = result[0]['rec_scores'][i]
-
-                    if confidence >= 0:
-                        print(f"识别到文本: '{text}' (置信度: {confidence:.4f})")
-                    else:
-                        print(f"识别到文本: '{text}' (无置信度信息)")
-                    lines.append(text)
-            else:
-                print("--- [Real OCR] 警告: 未检测到 'rec_texts'。尝试备用列表解析... ---")
-                page_data = result[0]
-                if isinstance(page_data, list):
-                     for line_data in page_data:
-                        if isinstance(line_data, (list, tuple)) and len(line_data) == 2:
-                            text_info = line_data[1]
-                            if isinstance(text_info, tuple) and len(text_info) == 2:
-                                text = text_info[0]
-                                if text:
-                                    print(f"识别到文本 (备用): '{text}'")
-                                    lines.append(text)
-        except Exception as e:
-            print(f"--- [Real OCR] 解析时发生错误 (已捕获): {e} ---")
-            print(f"--- 原始 OCR 结果: {str(result)[:500]} ...")
-            return ""
+    lines = parse_ocr_result(result)
 
     full_text = "\n".join(lines)
     print("--- [Real OCR] 文本识别完成。 ---")
@@ -0,0 +1,193 @@
+import os
+from dataclasses import dataclass, asdict
+from importlib import metadata
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from paddleocr import PaddleOCR
+
+
+@dataclass(frozen=True)
+class OCRProfile:
+    """
+    一组 PaddleOCR 推理配置
+    值为 None 的字段表示沿用 PaddleOCR 的默认值
+    """
+    name: str
+    description: str
+    det_model: Optional[str] = None
+    rec_model: Optional[str] = None
+    # 文本行方向分类 (即 2.x 中的 use_angle_cls)，对正拍的手机照片基本没有收益
+    use_textline_orientation: bool = True
+    # 整图方向矫正 / 去扭曲 (PaddleOCR 3.x 默认开启)
+    use_doc_preprocessing: Optional[bool] = None
+    det_limit_side_len: Optional[int] = None
+    det_limit_type: Optional[str] = None
+    cpu_threads: Optional[int] = None
+    enable_mkldnn: Optional[bool] = None
+    # 高性能推理: 在 CPU 上自动选择 ONNX Runtime / OpenVINO 等后端 (仅 PaddleOCR 3.x)
+    enable_hpi: bool = False
+
+
+OCR_PROFILES: Dict[str, OCRProfile] = {
+    "fast": OCRProfile(
+        name="fast",
+        description="移动端模型，关闭方向分类，检测分辨率限制为 640",
+        det_model="PP-OCRv5_mobile_det",
+        rec_model="PP-OCRv5_mobile_rec",
+        use_textline_orientation=False,
+        use_doc_preprocessing=False,
+        det_limit_side_len=640,
+        det_limit_type="max",
+        cpu_threads=4,
+        enable_mkldnn=True,
+    ),
+    "balanced": OCRProfile(
+        name="balanced",
+        description="移动端检测 + 服务端识别，关闭方向分类，检测分辨率限制为 960",
+        det_model="PP-OCRv5_mobile_det",
+        rec_model="PP-OCRv5_server_rec",
+        use_textline_orientation=False,
+        use_doc_preprocessing=False,
+        det_limit_side_len=960,
+        det_limit_type="max",
+        cpu_threads=8,
+        enable_mkldnn=True,
+    ),
+    "accurate": OCRProfile(
+        name="accurate",
+        description="PaddleOCR 默认的模型和推理参数，开启方向分类 (与原有行为一致)",
+        use_textline_orientation=True,
+    ),
+}
+
+DEFAULT_PROFILE = "accurate"
+
+
+def _env_flag(name: str) -> Optional[bool]:
+    value = os.environ.get(name)
+    if value is None:
+        return None
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_profile(name: Optional[str] = None) -> OCRProfile:
+    """
+    获取 OCR 配置，未指定时读取环境变量 OCR_PROFILE
+    OCR_CPU_THREADS / OCR_ENABLE_HPI 可覆盖配置中的对应字段
+    """
+    name = (name or os.environ.get("OCR_PROFILE") or DEFAULT_PROFILE).strip().lower()
+    if name not in OCR_PROFILES:
+        raise ValueError(f"未知的 OCR 配置: {name}，可选: {', '.join(OCR_PROFILES)}")
+
+    overrides = asdict(OCR_PROFILES[name])
+    if os.environ.get("OCR_CPU_THREADS"):
+        overrides["cpu_threads"] = int(os.environ["OCR_CPU_THREADS"])
+    if _env_flag("OCR_ENABLE_HPI") is not None:
+        overrides["enable_hpi"] = _env_flag("OCR_ENABLE_HPI")
+    return OCRProfile(**overrides)
+
+
+def _paddleocr_version() -> str:
+    """读取已安装的 PaddleOCR 版本 (无需导入 paddleocr 本身)，未安装时返回空字符串"""
+    try:
+        return metadata.version("paddleocr")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def _build_kwargs(profile: OCRProfile) -> dict:
+    """将配置转换为当前安装的 PaddleOCR 版本所接受的参数"""
+    if _paddleocr_version().startswith("2."):
+        # 2.x 通过模型目录指定模型，这里只映射通用参数
+        kwargs = {
+            "lang": "ch",
+            "use_angle_cls": profile.use_textline_orientation,
+        }
+        if profile.cpu_threads is not None:
+            kwargs["cpu_threads"] = profile.cpu_threads
+        if profile.enable_mkldnn is not None:
+            kwargs["enable_mkldnn"] = profile.enable_mkldnn
+        if profile.det_limit_side_len is not None:
+            kwargs["det_limit_side_len"] = profile.det_limit_side_len
+        if profile.det_limit_type is not None:
+            kwargs["det_limit_type"] = profile.det_limit_type
+        if profile.enable_hpi:
+            # 2.x 的 use_onnx 需要预先转换好的 ONNX 模型目录，这里不做自动映射
+            print("--- 警告: PaddleOCR 2.x 不支持 enable_hpi (OCR_ENABLE_HPI)，已忽略该设置 ---")
+        return kwargs
+
+    kwargs = {
+        "lang": "ch",
+        "use_textline_orientation": profile.use_textline_orientation,
+    }
+    if profile.cpu_threads is not None:
+        kwargs["cpu_threads"] = profile.cpu_threads
+    if profile.enable_mkldnn is not None:
+        kwargs["enable_mkldnn"] = profile.enable_mkldnn
+    if profile.det_model is not None:
+        kwargs["text_detection_model_name"] = profile.det_model
+    if profile.rec_model is not None:
+        kwargs["text_recognition_model_name"] = profile.rec_model
+    if profile.use_doc_preprocessing is not None:
+        kwargs["use_doc_orientation_classify"] = profile.use_doc_preprocessing
+        kwargs["use_doc_unwarping"] = profile.use_doc_preprocessing
+    if profile.det_limit_side_len is not None:
+        kwargs["text_det_limit_side_len"] = profile.det_limit_side_len
+    if profile.det_limit_type is not None:
+        kwargs["text_det_limit_type"] = profile.det_limit_type
+    if profile.enable_hpi:
+        kwargs["enable_hpi"] = True
+    return kwargs
+
+
+def create_ocr_engine(profile: OCRProfile) -> "PaddleOCR":
+    """按配置初始化 PaddleOCR 引擎"""
+    # 延迟导入: 只解析配置或结果时不需要加载 PaddleOCR 及其模型依赖
+    from paddleocr import PaddleOCR
+
+    threads = profile.cpu_threads if profile.cpu_threads is not None else "默认"
+    print(f"--- 使用 OCR 配置 '{profile.name}': {profile.description} (cpu_threads={threads}) ---")
+    return PaddleOCR(**_build_kwargs(profile))
+
+
+def parse_ocr_result(result, verbose: bool = True) -> List[str]:
+    """
+    从 PaddleOCR 的返回结果中提取文本行
+    兼容 3.x (rec_texts / rec_scores) 与 2.x (列表) 两种结构
+    """
+    lines = []
+
+    if result and result[0] is not None:
+        try:
+            if 'rec_texts' in result[0] and 'rec_scores' in result[0]:
+                for i in range(len(result[0]['rec_texts'])):
+                    text = result[0]['rec_texts'][i]
+                    confidence = result[0]['rec_scores'][i]
+
+                    if verbose:
+                        if confidence >= 0:
+                            print(f"识别到文本: '{text}' (置信度: {confidence:.4f})")
+                        else:
+                            print(f"识别到文本: '{text}' (无置信度信息)")
+                    lines.append(text)
+            else:
+                if verbose:
+                    print("--- [Real OCR] 警告: 未检测到 'rec_texts'。尝试备用列表解析... ---")
+                page_data = result[0]
+                if isinstance(page_data, list):
+                     for line_data in page_data:
+                        if isinstance(line_data, (list, tuple)) and len(line_data) == 2:
+                            text_info = line_data[1]
+                            if isinstance(text_info, tuple) and len(text_info) == 2:
+                                text = text_info[0]
+                                if text:
+                                    if verbose:
+                                        print(f"识别到文本 (备用): '{text}'")
+                                    lines.append(text)
+        except Exception as e:
+            print(f"--- [Real OCR] 解析时发生错误 (已捕获): {e} ---")
+            print(f"--- 原始 OCR 结果: {str(result)[:500]} ...")
+            return []
+
+    return lines
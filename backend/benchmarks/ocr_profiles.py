@@ -0,0 +1,150 @@
+"""
+OCR 配置离线评测：对比 fast / balanced / accurate 三种配置的速度与准确率
+
+用法 (在 backend 目录下运行):
+    python benchmarks/ocr_profiles.py
+    python benchmarks/ocr_profiles.py --profiles fast,balanced --repeat 5 --json result.json
+
+样本目录中每张图片 (xxx.jpg) 对应一个同名的标注文件 (xxx.txt)，内容为海报上的文字。
+字符准确率 = 1 - 编辑距离 / 标注字符数 (忽略空白字符)，水印等未标注文字会被计为错误。
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.ocr_engine import OCR_PROFILES, get_profile, create_ocr_engine, parse_ocr_result  # noqa: E402
+
+DEFAULT_SAMPLES_DIR = os.path.join(BACKEND_DIR, "benchmarks", "samples")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def load_samples(samples_dir: str):
+    """读取样本图片及其标注文本"""
+    import cv2
+
+    samples = []
+    for filename in sorted(os.listdir(samples_dir)):
+        stem, ext = os.path.splitext(filename)
+        if ext.lower() not in IMAGE_EXTENSIONS:
+            continue
+        label_path = os.path.join(samples_dir, stem + ".txt")
+        if not os.path.exists(label_path):
+            print(f"警告: {filename} 缺少标注文件，已跳过")
+            continue
+        img = cv2.imread(os.path.join(samples_dir, filename), cv2.IMREAD_COLOR)
+        if img is None:
+            print(f"警告: 无法读取图片 {filename}，已跳过")
+            continue
+        with open(label_path, encoding="utf-8") as f:
+            samples.append((stem, img, f.read()))
+    return samples
+
+
+def _normalize(text: str) -> str:
+    return "".join(text.split())
+
+
+def edit_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def char_accuracy(predicted: str, reference: str) -> float:
+    reference = _normalize(reference)
+    if not reference:
+        return 0.0
+    return max(0.0, 1 - edit_distance(_normalize(predicted), reference) / len(reference))
+
+
+def _percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def evaluate_profile(name: str, samples, repeat: int, warmup: int) -> dict:
+    profile = get_profile(name)
+
+    start = time.perf_counter()
+    engine = create_ocr_engine(profile)
+    init_seconds = time.perf_counter() - start
+
+    # 预热: 首次推理包含模型加载与内存分配，不计入延迟统计
+    for _ in range(warmup):
+        engine.ocr(samples[0][1])
+
+    latencies = []
+    accuracies = {}
+    for stem, img, reference in samples:
+        text = ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = engine.ocr(img)
+            latencies.append((time.perf_counter() - start) * 1000)
+            text = "\n".join(parse_ocr_result(result, verbose=False))
+        accuracies[stem] = char_accuracy(text, reference)
+
+    return {
+        "profile": name,
+        "cpu_threads": profile.cpu_threads,
+        "init_s": round(init_seconds, 2),
+        "latency_mean_ms": round(statistics.mean(latencies), 1),
+        "latency_p50_ms": round(_percentile(latencies, 50), 1),
+        "latency_p95_ms": round(_percentile(latencies, 95), 1),
+        "char_accuracy": round(statistics.mean(accuracies.values()), 4),
+        "per_sample_accuracy": {stem: round(acc, 4) for stem, acc in accuracies.items()},
+    }
+
+
+def print_table(results):
+    header = f"{'profile':<10}{'threads':>8}{'init(s)':>9}{'mean(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'acc':>8}"
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        # cpu_threads 为 None 表示沿用 PaddleOCR 默认值
+        threads = "-" if r["cpu_threads"] is None else r["cpu_threads"]
+        print(
+            f"{r['profile']:<10}{threads:>8}{r['init_s']:>9}{r['latency_mean_ms']:>10}"
+            f"{r['latency_p50_ms']:>10}{r['latency_p95_ms']:>10}{r['char_accuracy']:>8.2%}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="评测各 OCR 配置的延迟与字符准确率")
+    parser.add_argument("--profiles", default=",".join(OCR_PROFILES), help="逗号分隔的配置名称")
+    parser.add_argument("--samples", default=DEFAULT_SAMPLES_DIR, help="样本目录 (图片 + 同名 .txt 标注)")
+    parser.add_argument("--repeat", type=int, default=3, help="每张图片重复推理的次数")
+    parser.add_argument("--warmup", type=int, default=1, help="预热推理次数")
+    parser.add_argument("--json", dest="json_path", help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    samples = load_samples(args.samples)
+    if not samples:
+        sys.exit(f"样本目录 {args.samples} 中没有可用的样本")
+    print(f"共加载 {len(samples)} 个样本")
+
+    results = [
+        evaluate_profile(name.strip(), samples, args.repeat, args.warmup)
+        for name in args.profiles.split(",") if name.strip()
+    ]
+    print_table(results)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已写入 {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
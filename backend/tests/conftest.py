@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# 让测试可以直接 import app (与 uvicorn 在 backend 目录下启动时一致)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import crud, models  # noqa: E402
+from app.cache import response_cache  # noqa: E402
+from app.database import get_db  # noqa: E402
+from app.routers import posters  # noqa: E402
+from app.schemas.poster import PosterBase  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """每个测试使用独立的临时 SQLite 数据库"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    """只挂载 posters 路由 (extraction 路由依赖 PaddleOCR)"""
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    # 导出接口在流式生成器中自行创建会话
+    monkeypatch.setattr(posters, "SessionLocal", session_factory)
+
+    app = FastAPI()
+    app.include_router(posters.router, prefix="/api/v1")
+    app.dependency_overrides[get_db] = override_get_db
+
+    response_cache.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    response_cache.clear()
+
+
+@pytest.fixture
+def make_poster(db):
+    """通过 crud.create_poster 创建海报，与 /extract 接口的入库路径一致"""
+    def _make_poster(raw_text: str = "原始文本", **fields):
+        return crud.create_poster(db, PosterBase(**fields), raw_text=raw_text, image_url=None)
+    return _make_poster
@@ -0,0 +1,88 @@
+from app import crud
+from app.cache import response_cache
+
+
+def test_cache_key_encodes_query_parameters(client, make_poster):
+    make_poster(title="test 1")
+    make_poster(title="test 2")
+
+    # 搜索词本身包含 "&skip=0"，不能与真正的 search=t&skip=0 共用缓存
+    assert client.get("/api/v1/posters/", params={"search": "t&skip=0"}).json() == []
+    assert len(client.get("/api/v1/posters/", params={"search": "t", "skip": 0}).json()) == 2
+
+
+def test_large_limit_is_still_accepted(client, make_poster):
+    make_poster(title="讲座")
+    response = client.get("/api/v1/posters/", params={"limit": 100000})
+    assert response.status_code == 200 and len(response.json()) == 1
+
+
+def test_oversized_responses_are_not_cached(client, make_poster, monkeypatch):
+    make_poster(title="大文本", raw_text="字" * 2000)
+    monkeypatch.setattr(response_cache, "max_entry_bytes", 1000)
+
+    client.get("/api/v1/posters/")
+    assert response_cache.get("/api/v1/posters/?") is None
+
+
+def test_conditional_requests_return_304(client, make_poster):
+    make_poster(title="讲座")
+
+    response = client.get("/api/v1/posters/")
+    assert response.status_code == 200
+    etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+    not_modified = client.get("/api/v1/posters/", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    assert client.get("/api/v1/posters/", headers={"If-None-Match": '"stale"'}).status_code == 200
+    # 浏览器同时发送两个条件头时以 ETag 为准
+    both = {"If-None-Match": etag, "If-Modified-Since": last_modified}
+    assert client.get("/api/v1/posters/", headers=both).status_code == 304
+
+
+def test_if_modified_since_does_not_hide_same_second_writes(client, make_poster):
+    make_poster(title="讲座")
+    last_modified = client.get("/api/v1/posters/").headers["last-modified"]
+
+    # 同一秒内新增海报，Last-Modified 的秒级精度无法区分前后两个版本
+    make_poster(title="新海报")
+    response = client.get("/api/v1/posters/", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_writes_invalidate_list_stats_and_detail(client, make_poster, db):
+    first = make_poster(title="讲座")
+    second = make_poster(title="比赛")
+
+    list_etag = client.get("/api/v1/posters/").headers["etag"]
+    first_etag = client.get(f"/api/v1/posters/{first.id}").headers["etag"]
+    second_etag = client.get(f"/api/v1/posters/{second.id}").headers["etag"]
+    assert client.get("/api/v1/posters/stats").json()["by_status"] == {"pending": 2}
+
+    crud.update_poster_status(db, first.id, "approved")
+
+    # 列表、统计和被修改的海报立即失效，未修改的海报仍然命中缓存
+    assert client.get("/api/v1/posters/", headers={"If-None-Match": list_etag}).status_code == 200
+    detail = client.get(f"/api/v1/posters/{first.id}", headers={"If-None-Match": first_etag})
+    assert detail.status_code == 200 and detail.json()["status"] == "approved"
+    assert client.get(f"/api/v1/posters/{second.id}", headers={"If-None-Match": second_etag}).status_code == 304
+    assert client.get("/api/v1/posters/stats").json()["by_status"] == {"approved": 1, "pending": 1}
+
+    make_poster(title="新海报")
+    assert len(client.get("/api/v1/posters/").json()) == 3
+
+    crud.delete_poster(db, second.id)
+    assert client.get(f"/api/v1/posters/{second.id}").status_code == 404
+    assert client.get("/api/v1/posters/stats").json()["total"] == 2
+
+
+def test_status_update_endpoint_invalidates_cache(client, make_poster):
+    poster = make_poster(title="讲座")
+    assert client.get("/api/v1/posters/", params={"status": "pending"}).json()[0]["id"] == poster.id
+
+    assert client.put(f"/api/v1/posters/{poster.id}", json={"status": "rejected"}).status_code == 200
+    assert client.get("/api/v1/posters/", params={"status": "pending"}).json() == []
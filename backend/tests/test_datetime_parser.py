@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from app.services.datetime_parser import parse_event_datetime
+
+REFERENCE = datetime(2024, 1, 1)
+
+
+@pytest.mark.parametrize(
+    "date_str, time_str, expected_start, expected_end",
+    [
+        # 单日 + 开始时间，结束时间取当天结束
+        ("2025年10月28日", "下午 14:30", datetime(2025, 10, 28, 14, 30), datetime(2025, 10, 28, 23, 59, 59)),
+        ("2025/10/28", "14:00-16:00", datetime(2025, 10, 28, 14, 0), datetime(2025, 10, 28, 16, 0)),
+        ("2025-10-28", None, datetime(2025, 10, 28, 0, 0), datetime(2025, 10, 28, 23, 59, 59)),
+        # 区间之外的时间 (签到时间) 不影响结束时间
+        ("2025年10月28日", "14:00-16:00（签到13:30）", datetime(2025, 10, 28, 14, 0), datetime(2025, 10, 28, 16, 0)),
+        ("2025年10月28日", "14:00（13:30签到）", datetime(2025, 10, 28, 14, 0), datetime(2025, 10, 28, 23, 59, 59)),
+        # 多日活动
+        ("2022年9月15日-9月16日", "None", datetime(2022, 9, 15, 0, 0), datetime(2022, 9, 16, 23, 59, 59)),
+        ("2022年9月15日-16日", "上午9点-下午3点半", datetime(2022, 9, 15, 9, 0), datetime(2022, 9, 16, 15, 30)),
+        ("2025.9.15-9.16", None, datetime(2025, 9, 15, 0, 0), datetime(2025, 9, 16, 23, 59, 59)),
+        ("2025-09-30至10-02", None, datetime(2025, 9, 30, 0, 0), datetime(2025, 10, 2, 23, 59, 59)),
+        # 跨年区间: 结束日期省略年份时顺延到下一年
+        ("2025年12月30日-1月2日", None, datetime(2025, 12, 30, 0, 0), datetime(2026, 1, 2, 23, 59, 59)),
+        ("2025.12.30-1.2", None, datetime(2025, 12, 30, 0, 0), datetime(2026, 1, 2, 23, 59, 59)),
+        ("12月30日至1月2日", None, datetime(2024, 12, 30, 0, 0), datetime(2025, 1, 2, 23, 59, 59)),
+        # 超过 MAX_EVENT_SPAN (92 天) 的区间会被截断
+        ("2025年1月1日-12月31日", None, datetime(2025, 1, 1, 0, 0), datetime(2025, 4, 3, 0, 0)),
+        # 时段换算与跨午夜
+        ("2017年3月1日", "晚上7点", datetime(2017, 3, 1, 19, 0), datetime(2017, 3, 1, 23, 59, 59)),
+        ("2025年10月28日", "晚上10点-12点", datetime(2025, 10, 28, 22, 0), datetime(2025, 10, 29, 0, 0)),
+        ("2025年10月28日", "晚上12点", datetime(2025, 10, 29, 0, 0), datetime(2025, 10, 29, 0, 0)),
+        ("2025年10月28日", "中午12点", datetime(2025, 10, 28, 12, 0), datetime(2025, 10, 28, 23, 59, 59)),
+        ("2025年12月31日", "22:00-01:00", datetime(2025, 12, 31, 22, 0), datetime(2026, 1, 1, 1, 0)),
+        # 时间写在 date 字段里，缺省年份时使用参考时间的年份
+        ("10月28日 19:00-21:00", "未能识别", datetime(2024, 10, 28, 19, 0), datetime(2024, 10, 28, 21, 0)),
+        ("2025年10月28日 14:00", "None", datetime(2025, 10, 28, 14, 0), datetime(2025, 10, 28, 23, 59, 59)),
+    ],
+)
+def test_parse_event_datetime(date_str, time_str, expected_start, expected_end):
+    assert parse_event_datetime(date_str, time_str, reference=REFERENCE) == (expected_start, expected_end)
+
+
+@pytest.mark.parametrize("date_str", [None, "", "None", "未能识别", "2025-13-40", "待定", "14:00-16:00"])
+def test_unparseable_date_returns_none(date_str):
+    assert parse_event_datetime(date_str, "14:00", reference=REFERENCE) == (None, None)
@@ -0,0 +1,154 @@
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app import crud, models
+from app.migrations import run_migrations
+
+
+@pytest.fixture
+def utc_local_time(monkeypatch):
+    """固定服务器本地时区为 UTC，使时区换算的结果可预期"""
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_create_poster_parses_event_datetime(make_poster):
+    poster = make_poster(date="2025年10月28日", time="14:00-16:00")
+    assert poster.event_start == datetime(2025, 10, 28, 14, 0)
+    assert poster.event_end == datetime(2025, 10, 28, 16, 0)
+
+    unknown = make_poster(date="未能识别", time="未能识别")
+    assert unknown.event_start is None and unknown.event_end is None
+
+
+def test_backfill_adds_columns_and_parses_existing_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        # 新增 event_start / event_end 之前的表结构
+        conn.execute(text(
+            "CREATE TABLE posters (id INTEGER PRIMARY KEY, title VARCHAR(255), date VARCHAR(100), "
+            "time VARCHAR(100), location VARCHAR(255), organizer VARCHAR(255), summary TEXT, "
+            "speaker VARCHAR(255), event_type VARCHAR(100), target_audience VARCHAR(255), "
+            "contact_info VARCHAR(255), registration_info VARCHAR(255), image_url VARCHAR(500), "
+            "raw_ocr_text TEXT, status VARCHAR(50), created_at DATETIME, updated_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO posters (id, date, time, status, created_at) VALUES "
+            "(1, '2022年9月15日-9月16日', 'None', 'approved', '2022-09-01 10:00:00'), "
+            "(2, 'None', 'None', 'pending', '2022-09-01 10:00:00'), "
+            "(3, '3月1日', '晚上7点', 'pending', '2017-02-20 10:00:00')"
+        ))
+
+    run_migrations(engine)
+
+    columns = {col["name"] for col in inspect(engine).get_columns("posters")}
+    assert {"event_start", "event_end"} <= columns
+    indexes = {index["name"] for index in inspect(engine).get_indexes("posters")}
+    assert {"ix_posters_event_start", "ix_posters_event_type_event_start", "ix_posters_status_event_start"} <= indexes
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, event_start, event_end FROM posters ORDER BY id")).all()
+    assert rows[0][1].startswith("2022-09-15 00:00:00") and rows[0][2].startswith("2022-09-16 23:59:59")
+    assert rows[1][1] is None
+    # 缺少年份的日期以 created_at 的年份为准
+    assert rows[2][1].startswith("2017-03-01 19:00:00")
+
+    # 再次执行时不会重复添加列
+    run_migrations(engine)
+    engine.dispose()
+
+
+def _ids(response):
+    assert response.status_code == 200
+    return sorted(item["id"] for item in response.json())
+
+
+def test_long_running_event_is_found_mid_way(client, make_poster):
+    # 持续时间在 MAX_EVENT_SPAN 之内的长期活动，查询其中间的某一天也能命中
+    exhibition = make_poster(title="展览", date="2025年9月1日-11月30日")
+    params = {"date_from": "2025-10-20T00:00:00", "date_to": "2025-10-20T23:59:59"}
+    assert _ids(client.get("/api/v1/posters/", params=params)) == [exhibition.id]
+
+
+def test_list_filters_by_date_range_type_and_status(client, make_poster, db):
+    lecture = make_poster(title="讲座", date="2025年10月21日", time="14:00-16:00", event_type="讲座")
+    contest = make_poster(title="比赛", date="2025年10月20日-10月26日", event_type="竞赛")
+    old = make_poster(title="旧活动", date="2024年5月1日", event_type="讲座")
+    make_poster(title="未知日期", date="None")
+    crud.update_poster_status(db, old.id, "approved")
+
+    week = {"date_from": "2025-10-20T00:00:00", "date_to": "2025-10-26T23:59:59"}
+    assert _ids(client.get("/api/v1/posters/", params=week)) == [lecture.id, contest.id]
+    # 区间重叠: 只覆盖比赛中间的某一天也能查到
+    assert _ids(client.get("/api/v1/posters/", params={"date_from": "2025-10-23", "date_to": "2025-10-23T23:59:59"})) == [contest.id]
+    assert _ids(client.get("/api/v1/posters/", params={**week, "event_type": "讲座"})) == [lecture.id]
+    assert _ids(client.get("/api/v1/posters/", params={"event_type": "讲座", "status": "approved"})) == [old.id]
+
+
+def test_date_only_date_to_includes_the_whole_day(client, make_poster):
+    evening = make_poster(title="晚会", date="2025年10月26日", time="19:00-21:00")
+    make_poster(title="下周", date="2025年10月27日", time="09:00")
+
+    params = {"date_from": "2025-10-20", "date_to": "2025-10-26"}
+    assert _ids(client.get("/api/v1/posters/", params=params)) == [evening.id]
+    response = client.get("/api/v1/posters/export", params={**params, "format": "jsonl", "columns": "id"})
+    assert response.text.strip() == f'{{"id": {evening.id}}}'
+
+    # 完整的日期时间仍按原值比较
+    params = {"date_from": "2025-10-20", "date_to": "2025-10-26T18:00:00"}
+    assert _ids(client.get("/api/v1/posters/", params=params)) == []
+
+
+def test_timezone_aware_date_filters_are_converted_to_local_time(client, make_poster, utc_local_time):
+    poster = make_poster(date="2025年10月21日", time="20:00-22:00")
+
+    # 2025-10-22 04:00+08:00 即本地 (UTC) 2025-10-21 20:00，应当命中
+    params = {"date_from": "2025-10-22T04:00:00+08:00", "date_to": "2025-10-22T05:00:00+08:00"}
+    assert _ids(client.get("/api/v1/posters/", params=params)) == [poster.id]
+
+    params = {"date_from": "2025-10-22T07:00:00+08:00"}
+    assert _ids(client.get("/api/v1/posters/", params=params)) == []
+
+
+def _query_plan(engine, db, **filters):
+    query = crud.filter_posters(db.query(models.Poster), **filters)
+    query = crud.order_posters(query, filters.get("date_from"), filters.get("date_to")).limit(100)
+    compiled = query.statement.compile(dialect=engine.dialect)
+    params = compiled.construct_params()
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + str(compiled), tuple(params[name] for name in compiled.positiontup)
+        ).all()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "filters, index",
+    [
+        # "即将开始的活动"
+        ({"date_from": datetime(2025, 10, 20)}, "ix_posters_event_start"),
+        # "本周的活动"
+        ({"date_from": datetime(2025, 10, 20), "date_to": datetime(2025, 10, 26, 23, 59, 59)}, "ix_posters_event_start"),
+        ({"event_type": "讲座", "date_from": datetime(2025, 10, 20)}, "ix_posters_event_type_event_start"),
+        ({"status": "pending", "date_from": datetime(2025, 10, 20), "date_to": datetime(2025, 10, 26)}, "ix_posters_status_event_start"),
+    ],
+)
+def test_date_range_queries_use_event_start_indexes(engine, db, filters, index):
+    plan = _query_plan(engine, db, **filters)
+    # 只有一步按索引的范围查找，没有全表扫描，也没有额外的排序
+    assert len(plan) == 1
+    assert plan[0].startswith(f"SEARCH posters USING INDEX {index} (")
+
+
+def test_date_range_results_are_ordered_by_event_start(client, make_poster):
+    later = make_poster(title="后", date="2025年10月24日")
+    earlier = make_poster(title="前", date="2025年10月21日")
+
+    params = {"date_from": "2025-10-20T00:00:00"}
+    assert [item["id"] for item in client.get("/api/v1/posters/", params=params).json()] == [earlier.id, later.id]
@@ -0,0 +1,67 @@
+import csv
+import gzip
+import io
+import json
+
+
+def _seed(make_poster):
+    return [
+        make_poster(title="讲座, 第一场", date="2025年10月21日", time="14:00-16:00", event_type="讲座", raw_text="第一行\n第二行"),
+        make_poster(title="比赛", date="2025年10月25日", event_type="竞赛"),
+        make_poster(title="未知", date="None"),
+    ]
+
+
+def test_export_csv_with_selected_columns(client, make_poster):
+    posters = _seed(make_poster)
+
+    response = client.get("/api/v1/posters/export", params={"columns": "id,title,raw_ocr_text,event_start"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="posters.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["id", "title", "raw_ocr_text", "event_start"]
+    # 按 id 升序导出，逗号和换行被正确转义，空值导出为空字符串
+    assert rows[1] == [str(posters[0].id), "讲座, 第一场", "第一行\n第二行", "2025-10-21T14:00:00"]
+    assert rows[3] == [str(posters[2].id), "未知", "原始文本", ""]
+    assert len(rows) == 4
+
+
+def test_export_jsonl_applies_list_filters(client, make_poster):
+    posters = _seed(make_poster)
+
+    params = {"format": "jsonl", "columns": "id,event_type", "date_from": "2025-10-20", "date_to": "2025-10-26"}
+    response = client.get("/api/v1/posters/export", params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert records == [
+        {"id": posters[0].id, "event_type": "讲座"},
+        {"id": posters[1].id, "event_type": "竞赛"},
+    ]
+
+    response = client.get("/api/v1/posters/export", params={**params, "event_type": "竞赛"})
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [posters[1].id]
+
+
+def test_export_gzip(client, make_poster):
+    _seed(make_poster)
+
+    response = client.get("/api/v1/posters/export", params={"format": "jsonl", "gzip": "true"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert 'filename="posters.jsonl.gz"' in response.headers["content-disposition"]
+
+    records = [json.loads(line) for line in gzip.decompress(response.content).decode("utf-8").splitlines()]
+    assert len(records) == 3
+    # 未指定 columns 时导出全部列
+    assert "raw_ocr_text" in records[0] and "event_end" in records[0]
+
+
+def test_export_rejects_invalid_format_and_columns(client):
+    assert client.get("/api/v1/posters/export", params={"format": "xml"}).status_code == 400
+    response = client.get("/api/v1/posters/export", params={"columns": "id,bogus"})
+    assert response.status_code == 400
+    assert "bogus" in response.json()["detail"]
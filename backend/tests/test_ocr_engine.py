@@ -0,0 +1,97 @@
+import pytest
+
+from app.services import ocr_engine
+from benchmarks.ocr_profiles import char_accuracy, edit_distance
+
+
+@pytest.fixture(autouse=True)
+def clear_ocr_env(monkeypatch):
+    for name in ("OCR_PROFILE", "OCR_CPU_THREADS", "OCR_ENABLE_HPI"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def _kwargs(monkeypatch, version, profile_name):
+    monkeypatch.setattr(ocr_engine, "_paddleocr_version", lambda: version)
+    return ocr_engine._build_kwargs(ocr_engine.get_profile(profile_name))
+
+
+@pytest.mark.parametrize("version", ["2.7.3", "3.2.0"])
+def test_accurate_profile_keeps_paddleocr_defaults(monkeypatch, version):
+    kwargs = _kwargs(monkeypatch, version, "accurate")
+    # 只传入与原有 PaddleOCR(use_angle_cls=True, lang='ch') 等价的参数
+    if version.startswith("2."):
+        assert kwargs == {"lang": "ch", "use_angle_cls": True}
+    else:
+        assert kwargs == {"lang": "ch", "use_textline_orientation": True}
+
+
+def test_fast_profile_on_paddleocr_3(monkeypatch):
+    assert _kwargs(monkeypatch, "3.2.0", "fast") == {
+        "lang": "ch",
+        "use_textline_orientation": False,
+        "cpu_threads": 4,
+        "enable_mkldnn": True,
+        "text_detection_model_name": "PP-OCRv5_mobile_det",
+        "text_recognition_model_name": "PP-OCRv5_mobile_rec",
+        "use_doc_orientation_classify": False,
+        "use_doc_unwarping": False,
+        "text_det_limit_side_len": 640,
+        "text_det_limit_type": "max",
+    }
+
+
+def test_fast_profile_on_paddleocr_2(monkeypatch):
+    assert _kwargs(monkeypatch, "2.7.3", "fast") == {
+        "lang": "ch",
+        "use_angle_cls": False,
+        "cpu_threads": 4,
+        "enable_mkldnn": True,
+        "det_limit_side_len": 640,
+        "det_limit_type": "max",
+    }
+
+
+def test_env_overrides(monkeypatch):
+    monkeypatch.setenv("OCR_PROFILE", "Balanced")
+    monkeypatch.setenv("OCR_CPU_THREADS", "2")
+    monkeypatch.setenv("OCR_ENABLE_HPI", "true")
+
+    profile = ocr_engine.get_profile()
+    assert profile.name == "balanced" and profile.cpu_threads == 2 and profile.enable_hpi
+
+    kwargs = _kwargs(monkeypatch, "3.2.0", None)
+    assert kwargs["cpu_threads"] == 2 and kwargs["enable_hpi"] is True
+
+
+def test_enable_hpi_is_reported_as_ignored_on_paddleocr_2(monkeypatch, capsys):
+    monkeypatch.setenv("OCR_ENABLE_HPI", "1")
+    kwargs = _kwargs(monkeypatch, "2.7.3", "fast")
+    assert "enable_hpi" not in kwargs and "use_onnx" not in kwargs
+    assert "enable_hpi" in capsys.readouterr().out
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        ocr_engine.get_profile("turbo")
+
+
+def test_parse_ocr_result_v3():
+    result = [{"rec_texts": ["大学生运动会", "2022"], "rec_scores": [0.99, 0.95]}]
+    assert ocr_engine.parse_ocr_result(result, verbose=False) == ["大学生运动会", "2022"]
+
+
+def test_parse_ocr_result_quiet_fallback(capsys):
+    legacy_result = [[[[[0, 0]], ("海报标题", 0.98)]]]
+    assert ocr_engine.parse_ocr_result(legacy_result, verbose=False) == ["海报标题"]
+    assert capsys.readouterr().out == ""
+    assert ocr_engine.parse_ocr_result([None]) == []
+
+
+def test_char_accuracy():
+    assert edit_distance("kitten", "sitting") == 3
+    # 忽略空白与换行，只比较字符序列
+    assert char_accuracy("大学生\n运动会", "大学生 运动会") == 1.0
+    assert char_accuracy("大学生运动会2O22", "大学生运动会2022") == pytest.approx(0.9)
+    # 多识别出的水印等文字会拉低准确率，但不会低于 0
+    assert char_accuracy("水印" * 20, "校园") == 0.0
+    assert char_accuracy("", "校园") == 0.0